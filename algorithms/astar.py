@@ -1,19 +1,25 @@
 def astar(graph, start, end, heuristic=lambda x, y: 1):
-    import heapq
-    queue = [(0, 0, start, [])]
-    visited = set()
+    from algorithms.heap import heappush, heappop
+    queue = [(heuristic(start, end), 0, start)]
+    dist = {start: 0}
+    parent = {start: None}
     while queue:
-        (f, cost, node, path) = heapq.heappop(queue)
-        if node in visited:
+        (f, cost, node) = heappop(queue)
+        if cost > dist[node]:
             continue
-        visited.add(node)
-        path = path + [node]
         if node == end:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.reverse()
             return path
         for neighbor in graph[node]:
-            if neighbor not in visited:
-                weight = graph[node][neighbor].get("weight", 1)
-                g = cost + weight
+            weight = graph[node][neighbor].get("weight", 1)
+            g = cost + weight
+            if g < dist.get(neighbor, float("inf")):
+                dist[neighbor] = g
+                parent[neighbor] = node
                 h = heuristic(neighbor, end)
-                heapq.heappush(queue, (g + h, g, neighbor, path))
-    return []
\ No newline at end of file
+                heappush(queue, (g + h, g, neighbor))
+    return []
@@ -1,17 +1,24 @@
 def dijkstra(graph, start, end):
-    import heapq
-    queue = [(0, start, [])]
-    visited = set()
+    from algorithms.heap import heappush, heappop
+    queue = [(0, start)]
+    dist = {start: 0}
+    parent = {start: None}
     while queue:
-        (cost, node, path) = heapq.heappop(queue)
-        if node in visited:
+        (cost, node) = heappop(queue)
+        if cost > dist[node]:
             continue
-        visited.add(node)
-        path = path + [node]
         if node == end:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.reverse()
             return path
         for neighbor in graph[node]:
-            if neighbor not in visited:
-                weight = graph[node][neighbor].get("weight", 1)
-                heapq.heappush(queue, (cost + weight, neighbor, path))
-    return []
\ No newline at end of file
+            weight = graph[node][neighbor].get("weight", 1)
+            g = cost + weight
+            if g < dist.get(neighbor, float("inf")):
+                dist[neighbor] = g
+                parent[neighbor] = node
+                heappush(queue, (g, neighbor))
+    return []
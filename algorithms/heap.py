@@ -0,0 +1,47 @@
+# Min-heap 4-ary di atas list Python, pengganti heapq untuk dijkstra/astar.
+# Anak dari indeks i berada di 4*i+1 .. 4*i+4, sehingga tinggi heap ~log4(n).
+
+def heappush(heap, item):
+    heap.append(item)
+    _sift_up(heap, len(heap) - 1)
+
+
+def heappop(heap):
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    _sift_down(heap, 0)
+    return top
+
+
+def _sift_up(heap, i):
+    item = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 2
+        if item < heap[parent]:
+            heap[i] = heap[parent]
+            i = parent
+        else:
+            break
+    heap[i] = item
+
+
+def _sift_down(heap, i):
+    n = len(heap)
+    item = heap[i]
+    while True:
+        first = 4 * i + 1
+        if first >= n:
+            break
+        smallest = first
+        for child in range(first + 1, min(first + 4, n)):
+            if heap[child] < heap[smallest]:
+                smallest = child
+        if heap[smallest] < item:
+            heap[i] = heap[smallest]
+            i = smallest
+        else:
+            break
+    heap[i] = item
@@ -0,0 +1,120 @@
+import numpy as np
+from numba import njit
+
+# Dijkstra dan A* ter-JIT di atas graf CSR (indptr, indices, weights).
+# Antrian prioritas berupa binary heap berbasis array dengan lazy deletion,
+# sehingga kapasitasnya cukup jumlah edge + 1.
+
+
+@njit(cache=True)
+def _heap_push(keys, vals, size, key, val):
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        vals[i] = vals[parent]
+        i = parent
+    keys[i] = key
+    vals[i] = val
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(keys, vals, size):
+    top_key = keys[0]
+    top_val = vals[0]
+    size -= 1
+    key = keys[size]
+    val = vals[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[child + 1] < keys[child]:
+            child += 1
+        if key <= keys[child]:
+            break
+        keys[i] = keys[child]
+        vals[i] = vals[child]
+        i = child
+    keys[i] = key
+    vals[i] = val
+    return top_key, top_val, size
+
+
+@njit(cache=True)
+def path_to(parent, src, dst):
+    """Jalur src -> dst dari array parent, array kosong jika tidak terjangkau"""
+    if dst != src and parent[dst] < 0:
+        return np.empty(0, dtype=np.int32)
+    length = 1
+    node = dst
+    while node != src:
+        node = parent[node]
+        length += 1
+    path = np.empty(length, dtype=np.int32)
+    node = dst
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = parent[node]
+    return path
+
+
+@njit(cache=True)
+def dijkstra_csr(indptr, indices, weights, src, dst):
+    """(dist, parent) dari src; berhenti saat dst diambil, dst=-1 untuk semua node"""
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int32)
+    keys = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    vals = np.empty(indices.shape[0] + 1, dtype=np.int64)
+
+    dist[src] = 0.0
+    size = _heap_push(keys, vals, 0, 0.0, src)
+    while size > 0:
+        cost, node, size = _heap_pop(keys, vals, size)
+        if cost > dist[node]:
+            continue
+        if node == dst:
+            break
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            g = cost + weights[k]
+            if g < dist[neighbor]:
+                dist[neighbor] = g
+                parent[neighbor] = node
+                size = _heap_push(keys, vals, size, g, neighbor)
+    return dist, parent
+
+
+@njit(cache=True)
+def astar_csr(indptr, indices, weights, xs, ys, src, dst):
+    """(dist, parent) A* src -> dst dengan heuristik jarak Euclidean dari (xs, ys)"""
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int32)
+    keys = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    vals = np.empty(indices.shape[0] + 1, dtype=np.int64)
+
+    dist[src] = 0.0
+    h = np.hypot(xs[src] - xs[dst], ys[src] - ys[dst])
+    size = _heap_push(keys, vals, 0, h, src)
+    while size > 0:
+        f, node, size = _heap_pop(keys, vals, size)
+        cost = dist[node]
+        if f > cost + np.hypot(xs[node] - xs[dst], ys[node] - ys[dst]):
+            continue
+        if node == dst:
+            break
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            g = cost + weights[k]
+            if g < dist[neighbor]:
+                dist[neighbor] = g
+                parent[neighbor] = node
+                h = np.hypot(xs[neighbor] - xs[dst], ys[neighbor] - ys[dst])
+                size = _heap_push(keys, vals, size, g + h, neighbor)
+    return dist, parent
@@ -1,87 +1,33 @@
 import streamlit as st
 import networkx as nx
-import matplotlib.pyplot as plt
-from data.generated_graph import node_list, edge_list
+from algorithms.citygraph import CityGraph, min_elapsed_ns, reconstruct_path, tracemalloc_session
+from algorithms.numba_sssp import astar_csr
 from data.orders import orders
 import time
+import tracemalloc
 import pandas as pd
-import psutil
 import plotly.express as px
 import plotly.graph_objects as go
 import os
 import numpy as np
-
-class CityGraph:
-    def __init__(self):
-        self.graph = nx.DiGraph()
-        self.node_positions = {}
-        self._build_graph()
-        self._calculate_positions()
-
-    def _build_graph(self):
-        for node in node_list:
-            self.graph.add_node(node['id'], name=node['name'])
-        
-        for edge in edge_list:
-            time_cost = (edge['distance'] / edge['speed']) * (1 + edge['congestion'])
-            cost = edge['distance'] * (1 + 0.5 * edge['congestion']) * 1000  # Scale to thousands of rupiah
-            self.graph.add_edge(
-                edge['from'], 
-                edge['to'], 
-                weight=time_cost,
-                distance=edge['distance'],
-                cost=cost,  # Added cost attribute
-                label=f"{edge['distance']}km, {edge['speed']}km/h"
-            )
-            if not edge['oneway']:
-                self.graph.add_edge(
-                    edge['to'], 
-                    edge['from'], 
-                    weight=time_cost,
-                    distance=edge['distance'],
-                    cost=cost,  # Added cost attribute
-                    label=f"{edge['distance']}km, {edge['speed']}km/h"
-                )
-
-    def _calculate_positions(self):
-        pos = nx.spring_layout(self.graph, seed=42)
-        self.node_positions = pos
-
-    def get_shortest_path(self, start, end, algorithm):
-        start_time = time.time()
-        process = psutil.Process()
-        mem_before = process.memory_info().rss
-        
-        if algorithm == "Dijkstra":
-            path = nx.dijkstra_path(self.graph, start, end, weight='weight')
-        elif algorithm == "A*":
-            def heuristic(u, v):
-                x1, y1 = self.node_positions[u]
-                x2, y2 = self.node_positions[v]
-                return ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-            path = nx.astar_path(self.graph, start, end, heuristic=heuristic, weight='weight')
-        
-        mem_after = process.memory_info().rss
-        end_time = time.time()
-        
-        metrics = {
-            'time': end_time - start_time,
-            'memory': (mem_after - mem_before),
-            'path': path
-        }
-        
-        return path, metrics
+from scipy.sparse.csgraph import dijkstra
 
 class EnhancedCityGraph(CityGraph):
+    def __init__(self, base=None):
+        # Pakai ulang graf, layout, dan array CSR dari instance yang sudah ada
+        if base is not None:
+            self.__dict__.update(base.__dict__)
+        else:
+            super().__init__()
+
     def benchmark_order(self, order, algorithm):
         try:
             dest = order['destination']
             
-            path, metrics = self.get_shortest_path(0, dest, algorithm)
+            # Dijkstra dibenchmark lewat benchmark_orders_sssp; di sini satu pencarian per order
+            path, metrics = self.get_shortest_path_measured(0, dest, algorithm)
             
-            distance = sum(self.graph[u][v]['distance'] for u,v in zip(path[:-1], path[1:]))
-            time_cost = sum(self.graph[u][v]['weight'] for u,v in zip(path[:-1], path[1:]))
-            cost = sum(self.graph[u][v]['cost'] for u,v in zip(path[:-1], path[1:]))
+            distance, time_cost, cost = self.path_metrics(path)
             
             return {
                 'algorithm': algorithm,
@@ -96,54 +42,100 @@ class EnhancedCityGraph(CityGraph):
         except nx.NetworkXNoPath:
             return None
 
-def assign_orders(orders, vehicle_capacity):
-    sorted_orders = sorted(orders, key=lambda x: (-x['priority'], x['deadline']))
-    vehicles = []
-    current_load = []
-    total_weight = 0
-    
-    for order in sorted_orders:
-        if total_weight + order['weight'] <= vehicle_capacity:
-            current_load.append(order)
-            total_weight += order['weight']
-        else:
-            vehicles.append(current_load)
-            current_load = [order]
-            total_weight = order['weight']
-    
-    if current_load:
-        vehicles.append(current_load)
-    return vehicles
+    def benchmark_orders_sssp(self, orders):
+        """Benchmark Dijkstra semua order dengan satu SSSP scipy dari gudang"""
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter_ns()
+        dist, pred = self.sssp_scipy(0)
+        end_time = time.perf_counter_ns()
+        memory = tracemalloc.get_traced_memory()[1] - mem_before
+        elapsed = min_elapsed_ns(lambda: self.sssp_scipy(0), end_time - start_time)
+        
+        # Waktu satu SSSP dibagi rata ke order terjangkau yang dilayaninya
+        reachable = [o for o in orders if not np.isinf(dist[o['destination']])]
+        per_order_time = elapsed / 1e9 / max(len(reachable), 1)
+        results = []
+        for order in reachable:
+            path = reconstruct_path(pred, order['destination'])
+            distance, time_cost, cost = self.path_metrics(path)
+            results.append({
+                'algorithm': "Dijkstra",
+                'time': per_order_time,
+                'memory': memory,
+                'distance': distance,
+                'time_cost': time_cost,
+                'cost': cost,
+                'path': path,
+                'order_id': order['destination']
+            })
+        return results
+
+@st.cache_resource
+def get_city_graph():
+    """Graf dibangun sekali dan dipakai ulang di setiap rerun Streamlit"""
+    return CityGraph()
 
-def plot_network(graph, routes=None):
-    plt.figure(figsize=(12, 10))
-    nx.draw_networkx_nodes(graph.graph, graph.node_positions, node_color='lightblue', node_size=500)
-    nx.draw_networkx_edges(graph.graph, graph.node_positions, edge_color='gray', width=1)
-    nx.draw_networkx_labels(graph.graph, graph.node_positions, 
-                           {n[0]: n[1]['name'] for n in graph.graph.nodes(data=True)})
-    
-    if routes:
-        colors = plt.cm.tab10.colors
-        for i, path in enumerate(routes):
-            edges = list(zip(path[:-1], path[1:]))
-            nx.draw_networkx_edges(graph.graph, graph.node_positions, edgelist=edges,
-                                  edge_color=colors[i % len(colors)], width=2, alpha=0.8)
-    
-    plt.title("Peta Jaringan Logistik")
-    plt.axis('off')
-    return plt
+def get_enhanced_view(graph):
+    """EnhancedCityGraph yang berbagi state dengan graph, tanpa membangun ulang"""
+    return EnhancedCityGraph(base=graph)
+
+@st.cache_resource
+def _base_network_fig(_graph):
+    """Figure Plotly (WebGL) berisi edge, node, dan label; dibuat sekali"""
+    xs, ys = _graph.xs, _graph.ys
+    src, dst = _graph.edge_src, _graph.edge_dst
+    # Satu trace untuk semua edge: segmen dipisah NaN
+    edge_x = np.column_stack([xs[src], xs[dst], np.full(len(src), np.nan)]).ravel()
+    edge_y = np.column_stack([ys[src], ys[dst], np.full(len(src), np.nan)]).ravel()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=edge_x, y=edge_y, mode='lines', hoverinfo='skip',
+                               line=dict(color='gray', width=1), showlegend=False))
+    fig.add_trace(go.Scattergl(x=xs, y=ys, mode='markers+text', text=_graph.node_names,
+                               textposition='top center', hoverinfo='text',
+                               marker=dict(color='lightblue', size=18, line=dict(color='gray', width=1)),
+                               showlegend=False))
+    fig.update_layout(title="Peta Jaringan Logistik", height=800,
+                      xaxis=dict(visible=False), yaxis=dict(visible=False),
+                      margin=dict(l=10, r=10, t=50, b=10))
+    return fig
+
+def overlay_routes(fig, routes, graph):
+    """Salinan figure dasar dengan satu trace garis per rute kendaraan"""
+    fig = go.Figure(fig)
+    colors = px.colors.qualitative.D3
+    fig.add_traces([
+        go.Scattergl(x=graph.xs[path], y=graph.ys[path], mode='lines',
+                     line=dict(color=colors[i % len(colors)], width=4),
+                     opacity=0.8, name=f"Kendaraan {i + 1}")
+        for i, path in enumerate(routes or [])
+    ])
+    return fig
+
+@st.cache_data(show_spinner=False)
+def benchmark_orders(_graph, orders, algorithm):
+    """Mengembalikan (results, peak_memory); tracemalloc aktif sekali per batch"""
+    results = []
+    with tracemalloc_session():
+        if algorithm == "Dijkstra":
+            results = _graph.benchmark_orders_sssp(orders)
+        else:
+            for order in orders:
+                result = _graph.benchmark_order(order, algorithm)
+                if result:
+                    results.append(result)
+    peak_memory = max((r['memory'] for r in results), default=0)
+    return results, peak_memory
 
+@st.fragment
 def analyze_algorithm_performance(graph, orders, algorithm):
     """Analyze performance of a single algorithm"""
     st.subheader(f"📊 Analisis Kinerja Algoritma {algorithm}")
     
     # 1. Benchmark valid orders
-    results = []
     with st.spinner(f"Menganalisis kinerja {algorithm}..."):
-        for order in orders:
-            result = graph.benchmark_order(order, algorithm)
-            if result:
-                results.append(result)
+        results, peak_memory = benchmark_orders(graph, orders, algorithm)
     
     if not results:
         st.error("Tidak ada data hasil yang valid untuk dianalisis.")
@@ -156,32 +148,28 @@ def analyze_algorithm_performance(graph, orders, algorithm):
     with col1:
         st.metric("Waktu Komputasi Rata-rata", f"{df['time'].mean():.5f} detik")
     with col2:
-        st.metric("Memori Rata-rata", f"{df['memory'].mean()/1024:.2f} KB")
+        st.metric("Memori Puncak", f"{peak_memory/1024:.2f} KB")
     with col3:
         st.metric("Jarak Rata-rata", f"{df['distance'].mean():.2f} km")
     
     # 3. Detailed Charts
     st.subheader("Detail Metrik per Order")
     
-    tab1, tab2, tab3 = st.tabs(["Waktu & Memori", "Kualitas Solusi", "Detail Data"])
-    
-    with tab1:
-        col1, col2 = st.columns(2)
-        with col1:
-            fig = px.bar(df, x='order_id', y='time', 
-                        title=f'Waktu Komputasi ({algorithm})',
-                        labels={'order_id': 'ID Order', 'time': 'Waktu (detik)'})
-            fig.update_layout(xaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig)
-            
-        with col2:
-            fig = px.bar(df, x='order_id', y='memory', 
-                        title=f'Penggunaan Memori ({algorithm})',
-                        labels={'order_id': 'ID Order', 'memory': 'Memori (bytes)'})
-            fig.update_layout(xaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig)
+    # Hanya tab aktif yang dibangun; ganti tab hanya menjalankan ulang fragment ini
+    active_tab = st.radio("Tab", ["Waktu Komputasi", "Kualitas Solusi", "Detail Data"],
+                          horizontal=True, label_visibility="collapsed", key="active_tab")
     
-    with tab2:
+    if active_tab == "Waktu Komputasi":
+        if algorithm == "Dijkstra":
+            st.caption("Dijkstra melayani semua order dengan satu SSSP dari gudang, "
+                       "jadi waktunya dibagi rata dan setiap batang bernilai sama.")
+        fig = px.bar(df, x='order_id', y='time', 
+                    title=f'Waktu Komputasi ({algorithm})',
+                    labels={'order_id': 'ID Order', 'time': 'Waktu (detik)'})
+        fig.update_layout(xaxis={'categoryorder':'total ascending'})
+        st.plotly_chart(fig)
+    
+    elif active_tab == "Kualitas Solusi":
         col1, col2 = st.columns(2)
         with col1:
             fig = px.bar(df, x='order_id', y=['distance', 'time_cost', 'cost'], 
@@ -223,109 +211,103 @@ def analyze_algorithm_performance(graph, orders, algorithm):
             )
             st.plotly_chart(fig)
     
-    with tab3:
+    else:
         st.dataframe(df[['order_id', 'time', 'memory', 'distance', 'time_cost', 'cost']]
                     .sort_values('order_id'))
 
-def calculate_min_vehicles(orders, vehicle_capacity):
-    """Menghitung jumlah minimal kendaraan yang dibutuhkan"""
-    total_weight = sum(o['weight'] for o in orders if o['weight'] <= vehicle_capacity)
-    
-    # Hitung berdasarkan bin packing dengan prioritas
-    sorted_orders = sorted(
-        [o for o in orders if o['weight'] <= vehicle_capacity],
-        key=lambda x: (-x['priority'], x['deadline'])
-    )
-    
+def _pack_orders(valid_orders, vehicle_capacity):
+    """Bin-packing berurutan setelah sort (-priority, deadline)"""
+    # Urutkan (-priority, deadline) dengan lexsort (stabil, seperti sorted)
+    weight = np.array([o['weight'] for o in valid_orders], dtype=np.float64)
+    priority = np.array([o['priority'] for o in valid_orders])
+    deadline = np.array([o['deadline'] for o in valid_orders])
+    order_idx = np.lexsort((deadline, -priority))
+    sorted_orders = [valid_orders[i] for i in order_idx]
+    
+    # Batas kendaraan dicari di prefix-sum: kendaraan baru dimulai saat
+    # muatan kumulatif sejak awal kendaraan melebihi kapasitas
+    cum_weight = np.cumsum(weight[order_idx])
     vehicles = []
-    current_load = 0
-    
-    for order in sorted_orders:
-        if current_load + order['weight'] <= vehicle_capacity:
-            current_load += order['weight']
-        else:
-            vehicles.append(1)
-            current_load = order['weight']
-    
-    if current_load > 0:
-        vehicles.append(1)
-    
-    return max(len(vehicles), int(np.ceil(total_weight / vehicle_capacity)))
+    start = 0
+    while start < len(sorted_orders):
+        base = cum_weight[start - 1] if start > 0 else 0.0
+        end = int(np.searchsorted(cum_weight, base + vehicle_capacity, side='right'))
+        vehicles.append(sorted_orders[start:end])
+        start = end
+    return vehicles
 
 def assign_orders(orders, vehicle_capacity):
-    """Mengembalikan (vehicles, unassigned_orders)"""
+    """Mengembalikan (vehicles, unassigned_orders, min_vehicles)"""
     valid_orders = [o for o in orders if o['weight'] <= vehicle_capacity]
     invalid_orders = [{'id': o['id'], 'reason': 'capacity'} for o in orders if o['weight'] > vehicle_capacity]
     
-    sorted_orders = sorted(valid_orders, key=lambda x: (-x['priority'], x['deadline']))
+    # Setiap order valid pasti muat di satu kendaraan, jadi satu-satunya
+    # order yang tidak teralokasi adalah yang melebihi kapasitas
+    vehicles = _pack_orders(valid_orders, vehicle_capacity)
     
-    vehicles = []
-    current_vehicle = []
-    current_load = 0
-    
-    for order in sorted_orders:
-        if current_load + order['weight'] <= vehicle_capacity:
-            current_vehicle.append(order)
-            current_load += order['weight']
-        else:
-            vehicles.append(current_vehicle)
-            current_vehicle = [order]
-            current_load = order['weight']
+    # Minimal kendaraan: hasil bin packing, dibatasi bawah total muatan / kapasitas
+    total_weight = sum(o['weight'] for o in valid_orders)
+    min_vehicles = max(len(vehicles), int(np.ceil(total_weight / vehicle_capacity)))
+    return vehicles, invalid_orders, min_vehicles
+
+@st.cache_data(show_spinner=False)
+def measure_scalability(_graph, algorithm):
+    """Waktu & memori algoritma untuk jumlah node yang bertambah"""
+    # Jumlah node berskala log hingga seluruh node yang terjangkau dari gudang;
+    # node tak terjangkau ada di akhir urutan BFS dan tidak pernah jadi target
+    node_counts = np.unique(np.geomspace(5, _graph.num_reachable, 20).astype(int))
     
-    if current_vehicle:
-        vehicles.append(current_vehicle)
+    scalability_data = []
     
-    # Cek jika masih ada order yang belum teralokasi
-    assigned_ids = {o['id'] for vehicle in vehicles for o in vehicle}
-    unassigned = [{'id': o['id'], 'reason': 'vehicle_limit'} 
-                 for o in sorted_orders if o['id'] not in assigned_ids]
+    for n in node_counts:
+        n = int(n)
+        
+        # Id CSR berurutan BFS dari gudang: n node pertama = irisan CSR.
+        # Id int32 sama seperti CityGraph agar kernel Numba tidak dispesialisasi ulang
+        source, target = np.int32(0), np.int32(n - 1)
+        sub_csr = _graph.csr[:n, :n]
+        
+        if algorithm == "Dijkstra":
+            def run():
+                return dijkstra(sub_csr, indices=source)
+        else:  # A*
+            sub_xs, sub_ys = _graph.xs_csr[:n], _graph.ys_csr[:n]
+            def run():
+                return astar_csr(sub_csr.indptr, sub_csr.indices, sub_csr.data,
+                                 sub_xs, sub_ys, source, target)[0]
+        
+        # Pemanasan tanpa diukur: kompilasi/muat JIT tidak ikut terhitung
+        run()
+        
+        with tracemalloc_session():
+            tracemalloc.reset_peak()
+            mem_before = tracemalloc.get_traced_memory()[0]
+            start_time = time.perf_counter_ns()
+            dist = run()
+            end_time = time.perf_counter_ns()
+            mem_peak = tracemalloc.get_traced_memory()[1] - mem_before
+        
+        if np.isinf(dist[target]):
+            continue
+        
+        # Pengulangan pengukuran waktu dilakukan di luar tracemalloc
+        elapsed = min_elapsed_ns(run, end_time - start_time)
+        
+        scalability_data.append({
+            'nodes': n,
+            'time': elapsed / 1e9,
+            'memory': mem_peak
+        })
     
-    return vehicles, invalid_orders + unassigned
+    return scalability_data
 
+@st.fragment
 def analyze_scalability(graph, algorithm):
     """Analyze scalability of a single algorithm with increasing nodes"""
     st.subheader(f"🔍 Analisis Skalabilitas {algorithm}")
     
-    # Prepare data
-    node_counts = list(range(5, len(graph.graph.nodes()), 5))
-    if node_counts[-1] != len(graph.graph.nodes()):
-        node_counts.append(len(graph.graph.nodes()))
-    
-    scalability_data = []
-    
     with st.spinner(f"Menganalisis skalabilitas {algorithm}..."):
-        for n in node_counts:
-            valid_nodes = [node for node in graph.graph.nodes() if node < n]
-            if len(valid_nodes) < 2:  # Need at least 2 nodes
-                continue
-                
-            subgraph = graph.graph.subgraph(valid_nodes)
-            target = max(valid_nodes)
-            
-            try:
-                start_time = time.time()
-                process = psutil.Process()
-                mem_before = process.memory_info().rss
-                
-                if algorithm == "Dijkstra":
-                    nx.dijkstra_path(subgraph, 0, target)
-                else:  # A*
-                    def heuristic(u, v):
-                        x1, y1 = graph.node_positions[u]
-                        x2, y2 = graph.node_positions[v]
-                        return ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-                    nx.astar_path(subgraph, 0, target, heuristic=heuristic)
-                
-                mem_after = process.memory_info().rss
-                end_time = time.time()
-                
-                scalability_data.append({
-                    'nodes': len(valid_nodes),
-                    'time': end_time - start_time,
-                    'memory': mem_after - mem_before
-                })
-            except:
-                pass
+        scalability_data = measure_scalability(graph, algorithm)
     
     # Display scalability charts
     if scalability_data:
@@ -352,11 +334,57 @@ def analyze_scalability(graph, algorithm):
     else:
         st.error("Tidak dapat menganalisis skalabilitas dengan jaringan saat ini.")
 
+@st.cache_data
+def plan_deliveries(vehicle_capacity):
+    """Mengembalikan (min_vehicles, vehicles, unassigned_orders) per kapasitas"""
+    assigned_vehicles, unassigned_orders, min_vehicles = assign_orders(orders, vehicle_capacity)
+    return min_vehicles, assigned_vehicles, unassigned_orders
+
+def route_vehicle(graph, vehicle, algorithm):
+    """Rute satu kendaraan: gudang lalu tiap tujuan berurutan id node"""
+    path = [0]
+    # Dijkstra: tiap titik awal leg memakai pohon SSSP yang di-cache graph
+    for dest in sorted(o['destination'] for o in vehicle):
+        next_path = graph.get_shortest_path_fast(path[-1], dest, algorithm)
+        path += next_path[1:]
+    return path
+
+@st.cache_data
+def compute_routes(algorithm, vehicle_capacity):
+    """Mengembalikan (all_routes, total_metrics) untuk seluruh kendaraan"""
+    graph = get_city_graph()
+    _, assigned_vehicles, _ = plan_deliveries(vehicle_capacity)
+    
+    total_metrics = {'time': 0, 'memory': 0, 'distance': 0, 'time_cost': 0, 'cost': 0}
+    
+    # Waktu & memori diukur sekali untuk seluruh batch rute
+    with tracemalloc_session():
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter_ns()
+        all_routes = [route_vehicle(graph, vehicle, algorithm) for vehicle in assigned_vehicles]
+        end_time = time.perf_counter_ns()
+        total_metrics['memory'] = tracemalloc.get_traced_memory()[1] - mem_before
+    total_metrics['time'] = (end_time - start_time) / 1e9
+    
+    # Metrik rute dihitung sekali per rute kendaraan
+    for path in all_routes:
+        distance, time_cost, cost = graph.path_metrics(path)
+        total_metrics['distance'] += distance
+        total_metrics['time_cost'] += time_cost
+        total_metrics['cost'] += cost
+    
+    return all_routes, total_metrics
+
+@st.fragment
+def show_network(graph, routes):
+    st.plotly_chart(overlay_routes(_base_network_fig(graph), routes, graph))
+
 def main():
     st.title("🚚 DeliveryCepat - Optimasi Rute Pengiriman")
     
     # Initialize graph
-    graph = EnhancedCityGraph()
+    graph = get_city_graph()
     
     with st.sidebar:
         st.header("⚙️ Parameter")
@@ -372,11 +400,8 @@ def main():
         show_performance = st.checkbox("Tampilkan Analisis Kinerja")
         show_scalability = st.checkbox("Tampilkan Analisis Skalabilitas")
     
-    # Hitung jumlah kendaraan yang dibutuhkan
-    min_vehicles = calculate_min_vehicles(orders, vehicle_capacity)
-    
-    # Assign orders ke kendaraan
-    assigned_vehicles, unassigned_orders = assign_orders(orders, vehicle_capacity)
+    # Hitung jumlah kendaraan & assign orders ke kendaraan
+    min_vehicles, assigned_vehicles, unassigned_orders = plan_deliveries(vehicle_capacity)
     
     # Tampilkan informasi alokasi
     st.subheader(f"📦 Alokasi Pengiriman (Membutuhkan {min_vehicles} Kendaraan)")
@@ -385,42 +410,17 @@ def main():
     if unassigned_orders:
         st.error(f"⚠️ {len(unassigned_orders)} order tidak dapat diproses:")
         reasons = {
-            'capacity': "melebihi kapasitas kendaraan",
-            'vehicle_limit': "keterbatasan jumlah kendaraan"
+            'capacity': "melebihi kapasitas kendaraan"
         }
         for order in unassigned_orders:
             st.write(f"- Order {order['id']} ({reasons[order['reason']]})")
     
     # Hitung rute untuk semua kendaraan
-    all_routes = []
-    total_metrics = {'time': 0, 'memory': 0, 'distance': 0, 'time_cost': 0, 'cost': 0}
-    
-    for vehicle in assigned_vehicles:
-        destinations = [o['destination'] for o in vehicle]
-        path = [0]
-        vehicle_metrics = {'time': 0, 'memory': 0, 'distance': 0, 'time_cost': 0, 'cost': 0}
-        
-        for dest in sorted(destinations):
-            next_path, metrics = graph.get_shortest_path(path[-1], dest, algorithm)
-            path += next_path[1:]
-            
-            # Akumulasi metrik
-            vehicle_metrics['time'] += metrics['time']
-            vehicle_metrics['memory'] += metrics['memory']
-            vehicle_metrics['distance'] += sum(graph.graph[u][v]['distance'] for u, v in zip(next_path[:-1], next_path[1:]))
-            vehicle_metrics['time_cost'] += sum(graph.graph[u][v]['weight'] for u, v in zip(next_path[:-1], next_path[1:]))
-            vehicle_metrics['cost'] += sum(graph.graph[u][v]['cost'] for u, v in zip(next_path[:-1], next_path[1:]))
-        
-        all_routes.append(path)
-        
-        # Tambahkan ke total metrik
-        for key in total_metrics:
-            total_metrics[key] += vehicle_metrics[key]
+    all_routes, total_metrics = compute_routes(algorithm, vehicle_capacity)
     
     # Visualisasi
     st.subheader("🗺️ Visualisasi Peta & Rute")
-    fig = plot_network(graph, all_routes)
-    st.pyplot(fig)
+    show_network(graph, all_routes)
     
     # Performance Overview
     st.subheader("📊 Dashboard Kinerja")
@@ -430,19 +430,21 @@ def main():
     col3.metric("Total Biaya", f"Rp {total_metrics['cost']:,.0f}")
     
     col1, col2, col3 = st.columns(3)
-    col1.metric("Waktu Komputasi", f"{total_metrics['time']:.5f} detik")
-    col2.metric("Penggunaan Memori", f"{total_metrics['memory']/1024:.2f} KB")
+    col1.metric("Waktu Komputasi (wall)", f"{total_metrics['time']:.5f} detik",
+                help="Waktu wall seluruh batch rute, termasuk jalur yang diambil dari cache graph")
+    col2.metric("Penggunaan Memori", f"{total_metrics['memory']/1024:.2f} KB",
+                help="Memori puncak batch rute, termasuk jalur yang diambil dari cache graph")
     col3.metric("Kendaraan Digunakan", len(assigned_vehicles))
     
     # Detail Rute
     st.subheader("📋 Detail Pengiriman")
     for i, route in enumerate(all_routes, 1):
-        locations = [graph.graph.nodes[n]['name'] for n in route]
+        locations = [graph.node_names[n] for n in route]
         st.write(f"**Kendaraan {i}:** {' → '.join(locations)}")
     
     # Analisis tambahan
     if show_performance:
-        analyze_algorithm_performance(graph, orders, algorithm)
+        analyze_algorithm_performance(get_enhanced_view(graph), orders, algorithm)
     
     if show_scalability:
         analyze_scalability(graph, algorithm)
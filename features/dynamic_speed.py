@@ -1,10 +1,29 @@
-def apply_dynamic_speed(graph, hour):
-    for u, v, data in graph.edges(data=True):
-        base_speed = data.get("speed", 40)
-        if 7 <= hour <= 9 or 17 <= hour <= 19:
-            data["speed"] = base_speed * 0.6
-        else:
-            data["speed"] = base_speed
-        distance = data.get("distance", 1)
-        data["weight"] = distance / data["speed"]
-    return graph
\ No newline at end of file
+import numpy as np
+
+RUSH_HOUR_FACTOR = 0.6
+
+
+def rush_hour_factor(hour):
+    """Faktor kecepatan: melambat saat jam sibuk pagi & sore"""
+    return RUSH_HOUR_FACTOR if (7 <= hour <= 9 or 17 <= hour <= 19) else 1.0
+
+
+def apply_dynamic_speed(base_speed, distance, hour):
+    """Bobot waktu tempuh per edge (distance / speed) untuk jam tertentu"""
+    speed = np.asarray(base_speed, dtype=np.float64) * rush_hour_factor(hour)
+    return np.asarray(distance, dtype=np.float64) / speed
+
+
+def apply_dynamic_speed_graph(graph, hour):
+    """Adapter untuk DiGraph NetworkX: memperbarui atribut speed & weight edge"""
+    edges = list(graph.edges(data=True))
+    base_speed = np.fromiter((data.get("speed", 40) for _, _, data in edges),
+                             dtype=np.float64, count=len(edges))
+    distance = np.fromiter((data.get("distance", 1) for _, _, data in edges),
+                           dtype=np.float64, count=len(edges))
+    speed = base_speed * rush_hour_factor(hour)
+    weight = apply_dynamic_speed(base_speed, distance, hour)
+    for (_, _, data), s, w in zip(edges, speed.tolist(), weight.tolist()):
+        data["speed"] = s
+        data["weight"] = w
+    return graph
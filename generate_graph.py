@@ -1,6 +1,8 @@
 import networkx as nx
+import numpy as np
 import pickle
 from data.generated_graph import node_list, edge_list
+from algorithms.citygraph import directed_edge_arrays
 
 # Membuat graf berarah (directed graph)
 G = nx.DiGraph()
@@ -16,6 +18,22 @@ for edge in edge_list:
 
 # Menyimpan graf menggunakan pickle
 with open("data/city_graph.gpickle", "wb") as f:
-    pickle.dump(G, f)
+    pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-print("Graf berhasil disimpan dalam file generated_graph.gpickle")
\ No newline at end of file
+print("Graf berhasil disimpan dalam file generated_graph.gpickle")
+
+# Menyimpan graf sebagai array CSR (indptr, indices, weights) tanpa NetworkX.
+# Edge berarah & bobot waktu tempuh (dengan kemacetan) sama seperti CityGraph,
+# sehingga langsung bisa dipakai kernel Dijkstra/A* Numba (id node asli)
+node_names = np.empty(len(node_list), dtype=object)
+for node in node_list:
+    node_names[node["id"]] = node["name"]
+src, dst, time_cost, _, _, _ = directed_edge_arrays(edge_list)
+
+order = np.argsort(src, kind='stable')
+indptr = np.zeros(len(node_list) + 1, dtype=np.int32)
+np.cumsum(np.bincount(src, minlength=len(node_list)), out=indptr[1:])
+np.savez_compressed("data/city_graph.npz", indptr=indptr, indices=dst[order],
+                    weights=time_cost[order], node_names=node_names.astype(str))
+
+print("Graf CSR berhasil disimpan dalam file city_graph.npz")
@@ -4,7 +4,7 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from algorithms.dijkstra import dijkstra
 from algorithms.astar import astar
-from features.dynamic_speed import apply_dynamic_speed
+from features.dynamic_speed import apply_dynamic_speed_graph
 from features.multi_vehicle import assign_orders_to_vehicles
 from utils.loader import load_graph
 
@@ -22,7 +22,7 @@ vehicle_count = st.sidebar.slider("Jumlah Kendaraan", 1, 5, 2)
 if st.button("🔍 Jalankan Optimasi"):
     st.subheader("Hasil Optimasi")
 
-    dynamic_graph = apply_dynamic_speed(graph.copy(), hour)
+    dynamic_graph = apply_dynamic_speed_graph(graph.copy(), hour)
 
     if algo == "Dijkstra":
         path_func = dijkstra
@@ -1,5 +1,11 @@
 import pickle
+import numpy as np
 
 def load_graph(path):
     with open(path, "rb") as f:
-        return pickle.load(f)
\ No newline at end of file
+        return pickle.load(f)
+
+def load_csr(path):
+    """Memuat array CSR (indptr, indices, weights, node_names) dari city_graph.npz, siap dipakai kernel Numba"""
+    with np.load(path) as data:
+        return data["indptr"], data["indices"], data["weights"], data["node_names"]